@@ -1,7 +1,13 @@
+from array import array
 from dataclasses import dataclass
-from typing import Dict, Tuple, List
+from typing import Dict, Iterator, List, Tuple, Union
 
-@dataclass(frozen=True)
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+@dataclass(frozen=True, slots=True)
 class Cell:
     x: int
     y: int
@@ -11,35 +17,186 @@ class Cell:
         return f"Cell({self.x}, {self.y}, '{self.char}')"
 
 
+class CellArray:
+    """Structure-of-arrays cell storage: three parallel NumPy columns.
+
+    Keeps coordinates and characters in contiguous typed arrays so bounds,
+    deduplication and rasterization run as C-level array operations instead
+    of per-Cell attribute loops.
+    """
+
+    __slots__ = ('xs', 'ys', 'chars')
+
+    def __init__(self, xs, ys, chars):
+        self.xs = xs
+        self.ys = ys
+        self.chars = chars
+
+    @classmethod
+    def from_cells(cls, cells: List[Cell]) -> "CellArray":
+        count = len(cells)
+        xs = np.fromiter((c.x for c in cells), dtype=np.int32, count=count)
+        ys = np.fromiter((c.y for c in cells), dtype=np.int32, count=count)
+        chars = np.array([c.char for c in cells]) if count else np.array([], dtype='U1')
+        return cls(xs, ys, chars)
+
+    def __len__(self) -> int:
+        return len(self.xs)
+
+    def __iter__(self) -> Iterator[Cell]:
+        for x, y, char in zip(self.xs, self.ys, self.chars):
+            yield Cell(int(x), int(y), str(char))
+
+
 class ArtGrid:
-    def __init__(self, cells: List[Cell]):
+    def __init__(self, cells: Union[List[Cell], CellArray]):
+        if np is not None and isinstance(cells, list) and cells:
+            cells = CellArray.from_cells(cells)
         self.cells = cells
+        self._lookup: Union[Dict[Tuple[int, int], str], None] = None
+        self._bounds: Union[Tuple[int, int, int, int], None] = None
+
+    @classmethod
+    def from_lookup(cls, lookup: Dict[Tuple[int, int], str],
+                    bounds: Tuple[int, int, int, int]) -> "ArtGrid":
+        """Build a grid directly from an (x, y) -> char mapping with known bounds.
+
+        Used by the fused parse path, which deduplicates into the mapping
+        while scanning and tracks bounds as it goes, so nothing has to be
+        re-derived here.
+        """
+        grid = cls([])
+        grid._lookup = lookup
+        grid._bounds = bounds
+        return grid
 
     def to_matrix(self, fill_char: str = ' ') -> List[str]:
-        if not self.cells:
+        if self._lookup is not None:
+            if not self._lookup:
+                return []
+            return self._to_matrix_lookup(fill_char)
+
+        if not len(self.cells):
             return []
 
+        if isinstance(self.cells, CellArray):
+            return self._to_matrix_numpy(fill_char)
+        return self._to_matrix_python(fill_char)
+
+    def _to_matrix_numpy(self, fill_char: str) -> List[str]:
+        xs, ys, chars = self.cells.xs, self.cells.ys, self.cells.chars
+        min_x, max_x = int(xs.min()), int(xs.max())
+        min_y, max_y = int(ys.min()), int(ys.max())
+
+        width = max_x - min_x + 1
+        height = max_y - min_y + 1
+        dtype = chars.dtype if chars.dtype.itemsize else 'U1'
+
+        grid = np.full((height, width), fill_char, dtype=dtype)
+        grid[max_y - ys, xs - min_x] = chars
+
+        return [''.join(row).rstrip() for row in grid]
+
+    def _to_matrix_python(self, fill_char: str) -> List[str]:
         xs = [c.x for c in self.cells]
         ys = [c.y for c in self.cells]
         min_x, max_x = min(xs), max(xs)
         min_y, max_y = min(ys), max(ys)
 
-        lookup: Dict[Tuple[int, int], str] = {(c.x, c.y): c.char for c in self.cells}
+        rows_map: Dict[int, List[Tuple[int, str]]] = {}
+        row_max: Dict[int, int] = {}
+        setdefault = rows_map.setdefault
+        max_get = row_max.get
+        single_chars = True
+        for c in self.cells:
+            if len(c.char) != 1:
+                single_chars = False
+            rel_x = c.x - min_x
+            setdefault(c.y, []).append((rel_x, c.char))
+            if rel_x > max_get(c.y, -1):
+                row_max[c.y] = rel_x
+
+        return ArtGrid._rasterize(rows_map, row_max, single_chars,
+                                  max_x - min_x + 1, min_y, max_y, fill_char)
+
+    def _to_matrix_lookup(self, fill_char: str) -> List[str]:
+        min_x, max_x, min_y, max_y = self._bounds
+
+        rows_map: Dict[int, List[Tuple[int, str]]] = {}
+        row_max: Dict[int, int] = {}
+        setdefault = rows_map.setdefault
+        max_get = row_max.get
+        single_chars = True
+        for (x, y), char in self._lookup.items():
+            if len(char) != 1:
+                single_chars = False
+            rel_x = x - min_x
+            setdefault(y, []).append((rel_x, char))
+            if rel_x > max_get(y, -1):
+                row_max[y] = rel_x
+
+        return ArtGrid._rasterize(rows_map, row_max, single_chars,
+                                  max_x - min_x + 1, min_y, max_y, fill_char)
+
+    @staticmethod
+    def _rasterize(rows_map: Dict[int, List[Tuple[int, str]]], row_max: Dict[int, int],
+                   single_chars: bool, width: int, min_y: int, max_y: int,
+                   fill_char: str) -> List[str]:
+        # With a whitespace fill the tail past the last cell is stripped
+        # anyway, so rows can be built only out to their last occupied
+        # column; a non-whitespace fill must keep the full width.
+        shrink = fill_char.isspace()
+
+        rows: List[str] = []
+        rows_get = rows_map.get
+        append = rows.append
+        if single_chars:
+            # Reuse one mutable char buffer across rows: write the occupied
+            # columns, snapshot the row, then reset only the dirty columns.
+            buf = array('u', fill_char * width)
+            for y in range(max_y, min_y - 1, -1):
+                entries = rows_get(y)
+                if not entries:
+                    append('' if shrink else fill_char * width)
+                    continue
+                row_width = row_max[y] + 1 if shrink else width
+                for x, char in entries:
+                    buf[x] = char
+                append(buf[:row_width].tounicode().rstrip())
+                for x, _ in entries:
+                    buf[x] = fill_char
+        else:
+            # Cells may legally carry up to three characters; array('u') only
+            # holds single code points, so fall back to a per-row list build.
+            for y in range(max_y, min_y - 1, -1):
+                entries = rows_get(y)
+                if not entries:
+                    append('' if shrink else fill_char * width)
+                    continue
+                row_width = row_max[y] + 1 if shrink else width
+                row = [fill_char] * row_width
+                for x, char in entries:
+                    row[x] = char
+                append(''.join(row).rstrip())
 
-        rows = []
-        for y in range(max_y, min_y - 1, -1):
-            row = ''.join(lookup.get((x, y), fill_char) for x in range(min_x, max_x + 1))
-            rows.append(row.rstrip())
-        
         return rows
 
     def get_bounds(self) -> Tuple[int, int, int, int]:
-        if not self.cells:
+        if self._lookup is not None:
+            return self._bounds if self._lookup else (0, 0, 0, 0)
+
+        if not len(self.cells):
             return (0, 0, 0, 0)
-        
+
+        if isinstance(self.cells, CellArray):
+            xs, ys = self.cells.xs, self.cells.ys
+            return (int(xs.min()), int(xs.max()), int(ys.min()), int(ys.max()))
+
         xs = [c.x for c in self.cells]
         ys = [c.y for c in self.cells]
         return (min(xs), max(xs), min(ys), max(ys))
 
     def get_cell_count(self) -> int:
-        return len(self.cells)
\ No newline at end of file
+        if self._lookup is not None:
+            return len(self._lookup)
+        return len(self.cells)
@@ -1,4 +1,5 @@
-from typing import List
+import sys
+from typing import List, Optional
 
 class Renderer:
     @staticmethod
@@ -6,9 +7,8 @@ class Renderer:
         if not lines:
             print("No ASCII art to display.")
             return
-        
-        for line in lines:
-            print(line)
+
+        sys.stdout.write('\n'.join(lines) + '\n')
 
     @staticmethod
     def render_with_border(lines: List[str], title: str = "ASCII Art") -> None:
@@ -18,25 +18,32 @@ class Renderer:
 
         max_width = max(len(line) for line in lines) if lines else 0
         border_width = max(max_width + 4, len(title) + 4)
-        
-        print("=" * border_width)
-        print(f"| {title.center(border_width - 4)} |")
-        print("=" * border_width)
-        
-        for line in lines:
-            print(f"| {line.ljust(border_width - 4)} |")
-        
-        print("=" * border_width)
+        border = "=" * border_width
+
+        out = [border, f"| {title.center(border_width - 4)} |", border]
+        out.extend(f"| {line.ljust(border_width - 4)} |" for line in lines)
+        out.append(border)
+
+        sys.stdout.write('\n'.join(out) + '\n')
 
     @staticmethod
-    def render_debug_info(lines: List[str], cell_count: int, bounds: tuple) -> None:
+    def render_debug_info(lines: Optional[List[str]], cell_count: int, bounds: tuple) -> None:
+        """Print grid statistics, then the art itself.
+
+        Pass lines=None to report only the statistics (the --dry-run path,
+        where the matrix is never built).
+        """
         min_x, max_x, min_y, max_y = bounds
-        
-        print(f"Debug Info:")
-        print(f"  Cells parsed: {cell_count}")
-        print(f"  Grid bounds: X[{min_x}..{max_x}], Y[{min_y}..{max_y}]")
-        print(f"  Grid size: {max_x - min_x + 1}x{max_y - min_y + 1}")
-        print(f"  Output lines: {len(lines)}")
-        print()
-        
-        Renderer.render(lines)
\ No newline at end of file
+
+        info = (
+            f"Debug Info:\n"
+            f"  Cells parsed: {cell_count}\n"
+            f"  Grid bounds: X[{min_x}..{max_x}], Y[{min_y}..{max_y}]\n"
+            f"  Grid size: {max_x - min_x + 1}x{max_y - min_y + 1}\n"
+        )
+        if lines is None:
+            sys.stdout.write(info)
+            return
+
+        sys.stdout.write(info + f"  Output lines: {len(lines)}\n\n")
+        Renderer.render(lines)
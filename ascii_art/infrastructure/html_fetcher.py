@@ -1,21 +1,44 @@
+import hashlib
+import json
+import os
 import requests
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
 import logging
-from typing import Optional
+from typing import List, Optional
 
 logger = logging.getLogger(__name__)
 
+try:
+    import brotli  # noqa: F401 - only advertise br when it can be decoded
+    _ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    _ACCEPT_ENCODING = "gzip, deflate"
+
+
+def _build_session() -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
 class HTMLFetcher:
     DEFAULT_TIMEOUT = 15
     DEFAULT_HEADERS = {
         "User-Agent": "ascii-art-viewer/1.0 (Python requests)",
         "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
         "Accept-Language": "en-US,en;q=0.5",
-        "Accept-Encoding": "gzip, deflate",
+        "Accept-Encoding": _ACCEPT_ENCODING,
         "Connection": "keep-alive",
     }
 
+    _session = _build_session()
+
     @staticmethod
-    def fetch(url: str, timeout: Optional[int] = None, headers: Optional[dict] = None) -> str:
+    def fetch(url: str, timeout: Optional[int] = None, headers: Optional[dict] = None,
+              session: Optional[requests.Session] = None) -> str:
         if timeout is None:
             timeout = HTMLFetcher.DEFAULT_TIMEOUT
         
@@ -25,7 +48,7 @@ class HTMLFetcher:
         logger.info(f"Fetching document from: {url}")
         
         try:
-            response = requests.get(url, headers=headers, timeout=timeout)
+            response = (session or HTMLFetcher._session).get(url, headers=headers, timeout=timeout)
             response.raise_for_status()
             
             content_length = len(response.text)
@@ -47,6 +70,134 @@ class HTMLFetcher:
             logger.error(f"Request failed: {str(e)}")
             raise
 
+    @staticmethod
+    def fetch_many(urls: List[str], timeout: Optional[int] = None,
+                   headers: Optional[dict] = None, max_workers: int = 8,
+                   session: Optional[requests.Session] = None) -> List[str]:
+        """Fetch several documents concurrently, preserving input order.
+
+        Downloads are I/O-bound, so a thread pool overlaps the network
+        round trips; the shared pooled session keeps connections reused
+        across workers.
+        """
+        if not urls:
+            return []
+
+        workers = min(max_workers, len(urls))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(
+                lambda url: HTMLFetcher.fetch(url, timeout=timeout, headers=headers,
+                                              session=session),
+                urls))
+
+    @staticmethod
+    def stream(url: str, timeout: Optional[int] = None, headers: Optional[dict] = None,
+               chunk_size: int = 65536, session: Optional[requests.Session] = None):
+        """Fetch the document as an iterator of decoded text chunks.
+
+        Lets the caller start parsing while the download is still in
+        flight, instead of materializing the whole response first.
+        """
+        if timeout is None:
+            timeout = HTMLFetcher.DEFAULT_TIMEOUT
+
+        if headers is None:
+            headers = HTMLFetcher.DEFAULT_HEADERS.copy()
+
+        logger.info(f"Streaming document from: {url}")
+
+        try:
+            response = (session or HTMLFetcher._session).get(url, headers=headers, timeout=timeout, stream=True)
+            response.raise_for_status()
+        except requests.exceptions.Timeout:
+            logger.error(f"Request timed out after {timeout} seconds")
+            raise
+        except requests.exceptions.ConnectionError:
+            logger.error(f"Failed to connect to {url}")
+            raise
+        except requests.exceptions.HTTPError as e:
+            logger.error(f"HTTP error {e.response.status_code}: {e.response.reason}")
+            raise
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Request failed: {str(e)}")
+            raise
+
+        if response.encoding is None:
+            response.encoding = 'utf-8'
+
+        def iter_chunks():
+            try:
+                yield from response.iter_content(chunk_size=chunk_size, decode_unicode=True)
+            finally:
+                response.close()
+
+        return iter_chunks()
+
+    @staticmethod
+    def fetch_cached(url: str, timeout: Optional[int] = None, headers: Optional[dict] = None,
+                     session: Optional[requests.Session] = None,
+                     cache_dir: Optional[str] = None) -> str:
+        """Fetch the document, revalidating a local disk cache when possible.
+
+        The body is stored under ~/.cache/ascii_art keyed by the SHA-256 of
+        the URL, together with the response's ETag/Last-Modified. Repeat
+        runs send a conditional request; a 304 answers from the cached file
+        instead of re-downloading the document.
+        """
+        if cache_dir is None:
+            cache_dir = os.path.join(
+                os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'),
+                'ascii_art')
+
+        key = hashlib.sha256(url.encode()).hexdigest()
+        body_path = os.path.join(cache_dir, key + '.html')
+        meta_path = os.path.join(cache_dir, key + '.meta')
+
+        if headers is None:
+            headers = HTMLFetcher.DEFAULT_HEADERS.copy()
+
+        meta = None
+        if os.path.exists(body_path) and os.path.exists(meta_path):
+            try:
+                with open(meta_path, encoding='utf-8') as f:
+                    meta = json.load(f)
+            except (OSError, ValueError):
+                meta = None
+        if meta:
+            if meta.get('etag'):
+                headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                headers['If-Modified-Since'] = meta['last_modified']
+
+        if timeout is None:
+            timeout = HTMLFetcher.DEFAULT_TIMEOUT
+
+        logger.info(f"Fetching document from: {url}")
+        response = (session or HTMLFetcher._session).get(url, headers=headers, timeout=timeout)
+
+        if response.status_code == 304 and meta is not None:
+            logger.info("Document unchanged (304), using cached copy")
+            with open(body_path, encoding='utf-8') as f:
+                return f.read()
+
+        response.raise_for_status()
+        text = response.text
+
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if text and (etag or last_modified):
+            try:
+                os.makedirs(cache_dir, exist_ok=True)
+                with open(body_path, 'w', encoding='utf-8') as f:
+                    f.write(text)
+                with open(meta_path, 'w', encoding='utf-8') as f:
+                    json.dump({'url': url, 'etag': etag, 'last_modified': last_modified}, f)
+            except OSError:
+                # A read-only or full cache directory must not break the fetch.
+                logger.debug("Could not write cache entry for %s", url)
+
+        return text
+
     @staticmethod
     def validate_url(url: str) -> bool:
         if not url:
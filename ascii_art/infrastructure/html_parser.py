@@ -1,11 +1,50 @@
+from functools import lru_cache
 from html.parser import HTMLParser
 import re
-from typing import List, Set
-from ascii_art.core.models import Cell
+from typing import Iterable, List, Set, Union
+from ascii_art.core.models import ArtGrid, Cell, CellArray
 import logging
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+try:
+    from lxml import etree
+except ImportError:
+    etree = None
+
 logger = logging.getLogger(__name__)
 
+_TEXT_XPATH = '//text()[not(ancestor::script) and not(ancestor::style)]'
+
+_HEADER_RE = re.compile(r'[xy][- ]coordinate|character', re.IGNORECASE)
+
+_VALID_CHARS = frozenset(
+    ' !"#$%&\'()*+,-./0123456789:;<=>?@ABCDEFGHIJKLMNOPQRSTUVWXYZ[\\]^_`abcdefghijklmnopqrstuvwxyz{|}~'
+    '█░▒▓▀▄▌▐■□▪▫▬▭▮▯°∙·‿⁀⁔⁕⁖⁗⁘⁙⁚⁛⁜⁝⁞'
+)
+
+if njit is not None and np is not None:
+    @njit(cache=True)
+    def _scan_triples_jit(is_int, is_char):
+        n = is_int.shape[0]
+        out = np.empty(n, dtype=np.int64)
+        k = 0
+        for i in range(n - 2):
+            if is_int[i] and is_char[i + 1] and is_int[i + 2]:
+                out[k] = i
+                k += 1
+        return out[:k]
+else:
+    _scan_triples_jit = None
+
 class TextCollector(HTMLParser):
     def __init__(self):
         super().__init__()
@@ -22,119 +61,205 @@ class TextCollector(HTMLParser):
 
     def handle_data(self, data):
         if not self.in_script_or_style:
-            text = data.strip()
-            if text:
-                self.texts.append(text)
+            self.texts.extend(filter(None, map(str.strip, data.splitlines())))
 
     def get_items(self) -> List[str]:
-        items = []
-        for text in self.texts:
-            for part in text.splitlines():
-                part = part.strip()
-                if part:
-                    items.append(part)
-        return items
+        return self.texts
 
 
 class GoogleDocParser:
-    INT_PATTERN = re.compile(r'^-?\d+$')
-    
     @staticmethod
-    def parse_ascii_art(html: str) -> List[Cell]:
-        collector = TextCollector()
-        collector.feed(html)
-        items = collector.get_items()
-        
-        logger.debug(f"Collected {len(items)} text items from HTML")
-        
+    def parse_ascii_art(html: Union[str, Iterable[str]]) -> Union[List[Cell], CellArray]:
+        debug = logger.isEnabledFor(logging.DEBUG)
+
+        items = GoogleDocParser._extract_text_items(html)
+
+        if debug:
+            logger.debug("Collected %d text items from HTML", len(items))
+
         items = GoogleDocParser._skip_preamble(items)
-        cells = GoogleDocParser._extract_coordinate_triples(items)
-        cells = GoogleDocParser._filter_and_validate_cells(cells)
-        
+        cells = GoogleDocParser._extract_coordinate_triples(items, debug)
+        cells = GoogleDocParser._filter_and_validate_cells(cells, debug)
+
         logger.info(f"Successfully parsed {len(cells)} ASCII art cells")
+        if np is not None and not isinstance(cells, CellArray):
+            return CellArray.from_cells(cells)
         return cells
 
+    @staticmethod
+    def parse_art_grid(html: Union[str, Iterable[str]]) -> ArtGrid:
+        """Parse HTML straight into an ArtGrid.
+
+        With NumPy the staged pipeline already works on compact arrays, so
+        this just wraps parse_ascii_art. Without it, the triple scan writes
+        directly into an (x, y) -> char mapping (setdefault keeps the first
+        occurrence, matching the old dedup pass) while tracking bounds, so
+        no intermediate cell list is ever materialized.
+        """
+        if np is not None:
+            return ArtGrid(GoogleDocParser.parse_ascii_art(html))
+
+        debug = logger.isEnabledFor(logging.DEBUG)
+
+        items = GoogleDocParser._extract_text_items(html)
+        if debug:
+            logger.debug("Collected %d text items from HTML", len(items))
+        items = GoogleDocParser._skip_preamble(items)
+
+        lookup = {}
+        min_x = min_y = max_x = max_y = 0
+        n = len(items)
+        if n >= 3:
+            is_int = [GoogleDocParser._is_integer(s) for s in items]
+            ints = [int(s) if flag else 0 for s, flag in zip(items, is_int)]
+            is_valid_character = GoogleDocParser._is_valid_character
+            setdefault = lookup.setdefault
+            limit = n - 2
+            first = True
+            for i in (k for k, flag in enumerate(is_int) if flag):
+                if i < limit and is_int[i + 2] and is_valid_character(items[i + 1]):
+                    x, y = ints[i], ints[i + 2]
+                    setdefault((x, y), items[i + 1])
+                    if first:
+                        min_x = max_x = x
+                        min_y = max_y = y
+                        first = False
+                    else:
+                        if x < min_x:
+                            min_x = x
+                        elif x > max_x:
+                            max_x = x
+                        if y < min_y:
+                            min_y = y
+                        elif y > max_y:
+                            max_y = y
+
+        logger.info(f"Successfully parsed {len(lookup)} ASCII art cells")
+        return ArtGrid.from_lookup(lookup, (min_x, max_x, min_y, max_y))
+
+    @staticmethod
+    def _extract_text_items(html: Union[str, Iterable[str]]) -> List[str]:
+        if etree is not None:
+            parser = etree.HTMLParser()
+            root = None
+            try:
+                if isinstance(html, str):
+                    parser.feed(html)
+                else:
+                    for chunk in html:
+                        parser.feed(chunk)
+                root = parser.close()
+            except etree.XMLSyntaxError:
+                # Empty or unparseable document; treat it as containing no text.
+                root = None
+            items: List[str] = []
+            if root is not None:
+                for text in root.xpath(_TEXT_XPATH):
+                    items.extend(filter(None, map(str.strip, text.splitlines())))
+            return items
+
+        collector = TextCollector()
+        if isinstance(html, str):
+            collector.feed(html)
+        else:
+            for chunk in html:
+                collector.feed(chunk)
+        return collector.get_items()
+
     @staticmethod
     def _skip_preamble(items: List[str]) -> List[str]:
-        header_patterns = [
-            "x-coordinate",
-            "x coordinate", 
-            "character",
-            "y-coordinate",
-            "y coordinate"
-        ]
-        
+        search = _HEADER_RE.search
         for i, item in enumerate(items):
-            item_lower = item.lower()
-            for pattern in header_patterns:
-                if pattern in item_lower:
-                    logger.debug(f"Found header '{item}' at position {i}, skipping preamble")
-                    return items[i + 1:]
-        
+            if search(item):
+                logger.debug("Found header %r at position %d, skipping preamble", item, i)
+                return items[i + 1:]
+
         logger.debug("No header found, processing all items")
         return items
 
     @staticmethod
-    def _extract_coordinate_triples(items: List[str]) -> List[Cell]:
+    def _extract_coordinate_triples(items: List[str], debug: bool = False) -> List[Cell]:
         cells = []
-        
-        for i in range(len(items) - 2):
-            x_str, char_str, y_str = items[i:i+3]
-            
-            if (GoogleDocParser._is_integer(x_str) and 
-                GoogleDocParser._is_integer(y_str) and 
-                GoogleDocParser._is_valid_character(char_str)):
-                
-                try:
-                    x = int(x_str)
-                    y = int(y_str)
-                    cell = Cell(x, y, char_str)
+        n = len(items)
+        if n < 3:
+            return cells
+
+        is_int = [GoogleDocParser._is_integer(s) for s in items]
+        ints = [int(s) if flag else 0 for s, flag in zip(items, is_int)]
+
+        if _scan_triples_jit is not None:
+            is_char = np.array([GoogleDocParser._is_valid_character(s) for s in items],
+                               dtype=np.bool_)
+            hits = _scan_triples_jit(np.array(is_int, dtype=np.bool_), is_char)
+            for i in hits:
+                cell = Cell(ints[i], ints[i + 2], items[i + 1])
+                cells.append(cell)
+                if debug:
+                    logger.debug("Found cell: %s", cell)
+        else:
+            # Only integer items can open a triple, so walk just those
+            # positions instead of every sliding window.
+            is_valid_character = GoogleDocParser._is_valid_character
+            limit = n - 2
+            for i in (k for k, flag in enumerate(is_int) if flag):
+                if i < limit and is_int[i + 2] and is_valid_character(items[i + 1]):
+                    cell = Cell(ints[i], ints[i + 2], items[i + 1])
                     cells.append(cell)
-                    logger.debug(f"Found cell: {cell}")
-                except ValueError as e:
-                    logger.warning(f"Failed to parse coordinates ({x_str}, {y_str}): {e}")
-        
-        logger.debug(f"Extracted {len(cells)} coordinate triples")
+                    if debug:
+                        logger.debug("Found cell: %s", cell)
+
+        if debug:
+            logger.debug("Extracted %d coordinate triples", len(cells))
         return cells
 
     @staticmethod
-    def _filter_and_validate_cells(cells: List[Cell]) -> List[Cell]:
+    def _filter_and_validate_cells(cells: List[Cell], debug: bool = False) -> Union[List[Cell], CellArray]:
         if not cells:
             return cells
-        
+
+        if np is not None:
+            data = cells if isinstance(cells, CellArray) else CellArray.from_cells(cells)
+            keys = (data.xs.astype(np.int64) << 32) | (data.ys.astype(np.int64) & 0xffffffff)
+            _, first = np.unique(keys, return_index=True)
+            if debug and len(first) != len(keys):
+                logger.debug("Removed %d duplicate cells", len(keys) - len(first))
+            first.sort()
+            unique = CellArray(data.xs[first], data.ys[first], data.chars[first])
+            if debug:
+                logger.debug("Grid bounds: X[%d..%d], Y[%d..%d]",
+                             unique.xs.min(), unique.xs.max(),
+                             unique.ys.min(), unique.ys.max())
+            return unique
+
         seen_positions: Set[tuple] = set()
         unique_cells = []
-        
+
         for cell in cells:
             position = (cell.x, cell.y)
             if position not in seen_positions:
                 seen_positions.add(position)
                 unique_cells.append(cell)
-            else:
-                logger.debug(f"Removing duplicate cell at position {position}")
-        
-        if unique_cells:
+            elif debug:
+                logger.debug("Removing duplicate cell at position %s", position)
+
+        if unique_cells and debug:
             xs = [c.x for c in unique_cells]
             ys = [c.y for c in unique_cells]
-            logger.debug(f"Grid bounds: X[{min(xs)}..{max(xs)}], Y[{min(ys)}..{max(ys)}]")
-        
+            logger.debug("Grid bounds: X[%d..%d], Y[%d..%d]", min(xs), max(xs), min(ys), max(ys))
+
         return unique_cells
 
     @staticmethod
+    @lru_cache(maxsize=1024)
     def _is_integer(text: str) -> bool:
-        return GoogleDocParser.INT_PATTERN.match(text) is not None
+        if text.startswith('-'):
+            text = text[1:]
+        return text.isdecimal()
 
     @staticmethod
+    @lru_cache(maxsize=1024)
     def _is_valid_character(text: str) -> bool:
         if len(text) == 0 or len(text) > 3:
             return False
-        
-        valid_chars = set(' !"#$%&\'()*+,-./0123456789:;<=>?@ABCDEFGHIJKLMNOPQRSTUVWXYZ[\\]^_`abcdefghijklmnopqrstuvwxyz{|}~')
-        unicode_blocks = set('█░▒▓▀▄▌▐■□▪▫▬▭▮▯°∙·‿⁀⁔⁕⁖⁗⁘⁙⁚⁛⁜⁝⁞')
-        
-        for char in text:
-            if char not in valid_chars and char not in unicode_blocks:
-                if not char.isprintable():
-                    return False
-        
-        return True
\ No newline at end of file
+
+        return all(char in _VALID_CHARS or char.isprintable() for char in text)
\ No newline at end of file
@@ -1,17 +1,54 @@
 import argparse
+import functools
+import os
 import logging
 import sys
-from ascii_art.infrastructure.html_fetcher import HTMLFetcher
-from ascii_art.infrastructure.html_parser import GoogleDocParser
-from ascii_art.core.models import ArtGrid
-from ascii_art.core.renderer import Renderer
+from dataclasses import dataclass
+from typing import List, Optional, Union
 
-logger = logging.getLogger(__name__)
+_USAGE_TEMPLATE = """\
+usage: {prog} [-h] [--url URL] [--urls FILE] [--fill FILL] [--debug] [--quiet]
+               [--border] [--info] [--dry-run] [--timeout TIMEOUT]
+               [--cache | --no-cache]
+"""
+
+_EPILOG = """
+Examples:
+  {prog} --url "https://docs.google.com/document/d/e/2PACX-.../pub"
+  {prog} -u "https://docs.google.com/.../pub" --fill "."
+  {prog} --url "https://docs.google.com/.../pub" --debug
+"""
+
+# Pre-rendered copy of the argparse help so -h/--help and empty
+# invocations can answer without constructing the parser at all.
+_HELP_TEMPLATE = _USAGE_TEMPLATE + """
+ASCII Art Viewer - Extract and display ASCII art from Google Docs
+
+options:
+  -h, --help            show this help message and exit
+  --url URL, -u URL     Published Google Docs URL ending with /pub
+  --urls FILE           File with one published Google Docs URL per line;
+                        documents are fetched concurrently and rendered in order
+  --fill FILL, -f FILL  Character to fill empty cells (default: space)
+  --debug               Enable debug logging
+  --quiet, -q           Suppress info messages (only show errors)
+  --border              Display ASCII art with a decorative border
+  --info                Show debug information about the parsed grid
+  --dry-run             With --info, report grid statistics without building
+                        or printing the art
+  --timeout TIMEOUT     Request timeout in seconds (default: 15)
+  --cache, --no-cache   Reuse a local copy of the document when the server
+                        says it is unchanged (default: on)
+""" + _EPILOG
 
 def setup_logging(debug: bool = False, quiet: bool = False) -> None:
     if quiet:
-        level = logging.WARNING
-    elif debug:
+        # Quiet runs emit no records of their own, so just raise the root
+        # level; basicConfig would install a handler and an atexit flush
+        # hook that the fast path never needs.
+        logging.root.setLevel(logging.WARNING)
+        return
+    if debug:
         level = logging.DEBUG
     else:
         level = logging.INFO
@@ -26,84 +63,240 @@ def setup_logging(debug: bool = False, quiet: bool = False) -> None:
         handlers=[logging.StreamHandler(sys.stderr)]
     )
 
+@functools.lru_cache(maxsize=1)
 def create_argument_parser() -> argparse.ArgumentParser:
+    # The examples epilog lives in _EPILOG and is shown by the static help
+    # fast path; the parser itself never needs to store or format it.
     parser = argparse.ArgumentParser(
         description="ASCII Art Viewer - Extract and display ASCII art from Google Docs",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  %(prog)s --url "https://docs.google.com/document/d/e/2PACX-.../pub"
-  %(prog)s -u "https://docs.google.com/.../pub" --fill "."
-  %(prog)s --url "https://docs.google.com/.../pub" --debug
-        """
     )
     
-    parser.add_argument("--url", "-u", required=True, help="Published Google Docs URL ending with /pub")
+    parser.add_argument("--url", "-u", help="Published Google Docs URL ending with /pub")
+    parser.add_argument("--urls", type=argparse.FileType('r'), metavar="FILE",
+                        help="File with one published Google Docs URL per line; "
+                             "documents are fetched concurrently and rendered in order")
     parser.add_argument("--fill", "-f", default=" ", help="Character to fill empty cells (default: space)")
     parser.add_argument("--debug", action="store_true", help="Enable debug logging")
     parser.add_argument("--quiet", "-q", action="store_true", help="Suppress info messages (only show errors)")
     parser.add_argument("--border", action="store_true", help="Display ASCII art with a decorative border")
     parser.add_argument("--info", action="store_true", help="Show debug information about the parsed grid")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="With --info, report grid statistics without building or printing the art")
     parser.add_argument("--timeout", type=int, default=15, help="Request timeout in seconds (default: 15)")
+    parser.add_argument("--cache", action=argparse.BooleanOptionalAction, default=True,
+                        help="Reuse a local copy of the document when the server says it is unchanged (default: on)")
     
     return parser
 
-def validate_arguments(args: argparse.Namespace) -> None:
-    if not HTMLFetcher.validate_url(args.url):
-        print("Error: Invalid Google Docs URL. Please provide a published Google Docs URL ending with /pub", 
-              file=sys.stderr)
-        sys.exit(1)
-    
+@dataclass(slots=True)
+class CliArgs:
+    """Parsed command-line options; attribute names mirror the argparse namespace.
+
+    The fast parser never handles --urls (it bails to argparse on any flag it
+    does not know), so the field only ever carries argparse's open file.
+    """
+    url: str
+    urls: Optional[object] = None
+    fill: str = ' '
+    debug: bool = False
+    quiet: bool = False
+    border: bool = False
+    info: bool = False
+    dry_run: bool = False
+    timeout: int = 15
+    cache: bool = True
+
+
+_VALUE_FLAGS = {'--url': 'url', '-u': 'url',
+                '--fill': 'fill', '-f': 'fill',
+                '--timeout': 'timeout'}
+_BOOL_FLAGS = {'--debug': ('debug', True),
+               '--quiet': ('quiet', True), '-q': ('quiet', True),
+               '--border': ('border', True),
+               '--info': ('info', True),
+               '--dry-run': ('dry_run', True),
+               '--cache': ('cache', True),
+               '--no-cache': ('cache', False)}
+
+
+def _parse_fast(argv: List[str]) -> Optional[CliArgs]:
+    """Parse well-formed argv in one linear scan, without argparse.
+
+    Returns None for anything unusual (unknown or abbreviated flags,
+    missing values, a bad --timeout), in which case the caller falls back
+    to argparse so error reporting is unchanged.
+    """
+    args = CliArgs(url='')
+    i = 0
+    n = len(argv)
+    while i < n:
+        token = argv[i]
+        if token in _BOOL_FLAGS:
+            attr, value = _BOOL_FLAGS[token]
+            setattr(args, attr, value)
+            i += 1
+            continue
+        name, eq, value = token.partition('=')
+        if name in _VALUE_FLAGS:
+            if not eq:
+                if i + 1 >= n:
+                    return None
+                value = argv[i + 1]
+                i += 1
+            setattr(args, _VALUE_FLAGS[name], value)
+            i += 1
+            continue
+        return None
+    if not args.url:
+        return None
+    if not isinstance(args.timeout, int):
+        try:
+            args.timeout = int(args.timeout)
+        except ValueError:
+            return None
+    return args
+
+
+def _die(message: str, code: int = 1, hard: bool = False) -> None:
+    sys.stderr.write(message + "\n")
+    if hard:
+        # Validation failures happen before anything needs cleanup, so skip
+        # interpreter finalization (atexit hooks, GC, logging shutdown).
+        sys.stderr.flush()
+        os._exit(code)
+    sys.exit(code)
+
+def _check_url(url: str) -> None:
+    # Plain string checks keep the misuse error path free of both the re
+    # module and the fetcher import (which drags in requests).
+    if not (url.startswith('https://docs.google.com/')
+            and (url.endswith('/pub') or '/pub?' in url or '/pub#' in url)):
+        _die("Error: Invalid Google Docs URL. Please provide a published Google Docs URL ending with /pub", hard=True)
+
+def validate_arguments(args: Union[CliArgs, argparse.Namespace]) -> None:
+    if args.urls is not None and args.url:
+        _die("Error: use either --url or --urls, not both", hard=True)
+    if args.urls is None and not args.url:
+        _die("Error: one of --url or --urls is required", hard=True)
+
+    if args.url:
+        _check_url(args.url)
+
     if len(args.fill) != 1:
-        print("Error: Fill character must be exactly one character", file=sys.stderr)
-        sys.exit(1)
-    
+        _die("Error: Fill character must be exactly one character", hard=True)
+
     if args.timeout <= 0:
-        print("Error: Timeout must be a positive number", file=sys.stderr)
-        sys.exit(1)
+        _die("Error: Timeout must be a positive number", hard=True)
 
 def run_cli() -> None:
-    parser = create_argument_parser()
-    args = parser.parse_args()
+    argv = sys.argv[1:]
+    prog = os.path.basename(sys.argv[0]) or "main.py"
+    if not argv:
+        sys.stderr.write(_USAGE_TEMPLATE.format(prog=prog))
+        sys.stderr.write(f"{prog}: error: the following arguments are required: --url/-u\n")
+        sys.exit(2)
+    if '-h' in argv or '--help' in argv:
+        sys.stdout.write(_HELP_TEMPLATE.format(prog=prog))
+        sys.exit(0)
+
+    # The one-pass parser handles the common, well-formed invocations;
+    # argparse remains the authority for everything else (abbreviations,
+    # unknown flags, error messages).
+    args = _parse_fast(argv)
+    if args is None:
+        args = create_argument_parser().parse_args(argv)
     
-    setup_logging(debug=args.debug, quiet=args.quiet)
+    # Only configure the logging machinery when debug output is wanted;
+    # the default and quiet paths write their one summary line directly.
+    if args.debug:
+        setup_logging(debug=True)
     validate_arguments(args)
     
+    import requests
+    from requests.adapters import HTTPAdapter, Retry
+    from ascii_art.infrastructure.html_fetcher import HTMLFetcher
+    from ascii_art.infrastructure.html_parser import GoogleDocParser
+    from ascii_art.core.renderer import Renderer
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=10,
+                          max_retries=Retry(total=2, backoff_factor=0.3))
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    # Narrow try blocks: network failures and data failures get their own
+    # handlers and messages instead of one catch-all around everything.
     try:
-        html = HTMLFetcher.fetch(args.url, timeout=args.timeout)
-        cells = GoogleDocParser.parse_ascii_art(html)
-        
-        if not cells:
-            print("No ASCII art data found in the document.", file=sys.stderr)
-            sys.exit(1)
-        
-        grid = ArtGrid(cells)
-        lines = grid.to_matrix(fill_char=args.fill)
-        
-        if not lines:
-            print("Failed to generate ASCII art grid.", file=sys.stderr)
-            sys.exit(1)
-        
-        if args.info:
-            bounds = grid.get_bounds()
-            cell_count = grid.get_cell_count()
-            Renderer.render_debug_info(lines, cell_count, bounds)
-        elif args.border:
-            Renderer.render_with_border(lines, "ASCII Art from Google Docs")
-        else:
-            Renderer.render(lines)
-        
-        logger.info(f"Successfully displayed ASCII art ({len(lines)} lines, {len(cells)} cells)")
-        
+        try:
+            if args.urls is not None:
+                with args.urls as f:
+                    urls = [line.strip() for line in f if line.strip()]
+                if not urls:
+                    _die("Error: --urls file contains no URLs")
+                for url in urls:
+                    _check_url(url)
+                # Fetch the gallery concurrently, then render in file order.
+                htmls = HTMLFetcher.fetch_many(urls, timeout=args.timeout,
+                                               max_workers=16, session=session)
+            elif args.cache:
+                htmls = [HTMLFetcher.fetch_cached(args.url, timeout=args.timeout, session=session)]
+            else:
+                htmls = [HTMLFetcher.stream(args.url, timeout=args.timeout, session=session)]
+        except requests.RequestException as e:
+            if args.debug:
+                logging.getLogger(__name__).exception("Fetch failed:")
+                sys.exit(1)
+            _die(f"Error: failed to fetch document: {str(e)}")
+
+        try:
+            multi = len(htmls) > 1
+            for html in htmls:
+                grid = GoogleDocParser.parse_art_grid(html)
+
+                cell_count = grid.get_cell_count()
+                if not cell_count:
+                    if multi:
+                        sys.stderr.write("[WARN] No ASCII art data found in one of the documents.\n")
+                        continue
+                    _die("No ASCII art data found in the document.")
+
+                if args.info and args.dry_run:
+                    # Statistics only: never build the O(rows x cols) matrix.
+                    Renderer.render_debug_info(None, cell_count, grid.get_bounds())
+                    continue
+
+                lines = grid.to_matrix(fill_char=args.fill)
+
+                if not lines:
+                    _die("Failed to generate ASCII art grid.")
+
+                if args.info:
+                    Renderer.render_debug_info(lines, cell_count, grid.get_bounds())
+                elif args.border:
+                    Renderer.render_with_border(lines, "ASCII Art from Google Docs")
+                else:
+                    # Plain output needs no ornamentation: one pre-joined bytes
+                    # write to the binary layer instead of per-line text printing.
+                    sys.stdout.buffer.write(('\n'.join(lines) + '\n').encode('utf-8'))
+                    sys.stdout.buffer.flush()
+
+                if not args.quiet:
+                    sys.stderr.write(f"[INFO] Successfully displayed ASCII art ({len(lines)} lines, {cell_count} cells)\n")
+        except requests.RequestException as e:
+            # Without the disk cache the body streams in during parsing, so
+            # a dropped connection can still surface here.
+            if args.debug:
+                logging.getLogger(__name__).exception("Fetch failed:")
+                sys.exit(1)
+            _die(f"Error: failed to fetch document: {str(e)}")
+        except Exception as e:
+            if args.debug:
+                logging.getLogger(__name__).exception("An error occurred:")
+                sys.exit(1)
+            _die(f"Error: {str(e)}")
+
     except KeyboardInterrupt:
-        print("\nOperation cancelled by user.", file=sys.stderr)
-        sys.exit(130)
-    except Exception as e:
-        if args.debug:
-            logger.exception("An error occurred:")
-        else:
-            logger.error(f"Error: {str(e)}")
-        sys.exit(1)
+        _die("\nOperation cancelled by user.", 130)
 
 if __name__ == "__main__":
     run_cli()
\ No newline at end of file